@@ -1,16 +1,50 @@
 import json
 import os
 import enum
-import re
 import datetime
+import time
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+import markdown
+import yaml
 from canvasapi import Canvas
-from typer import Typer
+from canvasapi.exceptions import RateLimitExceeded
+from canvasapi.file import File
+from typer import Context, Typer
 from rich import print
+from rich.markup import escape
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 CONFIG_FILE = ".canvas"
+PER_PAGE = 100  # Page size for Canvas list requests (the API default is 10)
+MAX_WORKERS = 16  # Upper bound on concurrent Canvas read requests
+MAX_WRITE_WORKERS = 8  # Upper bound on concurrent Canvas write requests
+RATE_LIMIT_RETRIES = 5  # Attempts per request when Canvas reports throttling
 app = Typer()
 
+# In-process cache of the parsed config file, keyed by its mtime
+_CONFIG_CACHE = None
+_CONFIG_MTIME = None
+
+# In-process caches of {name: object} lookups, keyed by course ID
+_ASSIGNMENTS_BY_NAME = {}
+_QUIZZES_BY_TITLE = {}
+_ROOT_FOLDER_IDS = {}
+
+# State shared by the running CLI command, set up by main()
+_CLI_STATE = contextvars.ContextVar("cli_state", default=None)
+
 
 #
 # Enum Classes
@@ -54,22 +88,31 @@ def load_config():
     Returns:
         dict: Configuration dictionary with API URL, key, and current course ID.
 
-    Creates a default configuration file if none exists.
+    Creates a default configuration file if none exists. The parsed result is
+    cached in-process and reused until the file's modification time changes.
     """
+    global _CONFIG_CACHE, _CONFIG_MTIME
+
     default_config = {
         "api_url": "https://your-institution.instructure.com",
         "api_key": "your-token",
         "current_course_id": None
     }
     try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        if _CONFIG_CACHE is not None and mtime == _CONFIG_MTIME:
+            return dict(_CONFIG_CACHE)
+        with open(CONFIG_FILE, "rb") as f:
+            config = _json_loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError):
         # Create default config file if it doesn't exist
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(default_config, f, indent=4)
+        save_config(default_config)
         return default_config
 
+    _CONFIG_CACHE = config
+    _CONFIG_MTIME = mtime
+    return dict(config)
+
 
 def save_config(config):
     """
@@ -78,9 +121,74 @@ def save_config(config):
     Args:
         config (dict): Configuration dictionary to save.
     """
+    global _CONFIG_CACHE, _CONFIG_MTIME
+
     with open(CONFIG_FILE, "w") as f:
         json.dump(config, f, indent=4)
 
+    # Drop memoized API clients if the credentials they were built with changed
+    if _CONFIG_CACHE is not None:
+        old_credentials = (_CONFIG_CACHE.get("api_url"), _CONFIG_CACHE.get("api_key"))
+        new_credentials = (config.get("api_url"), config.get("api_key"))
+        if old_credentials != new_credentials:
+            _canvas_for.cache_clear()
+            _course_for.cache_clear()
+
+    _CONFIG_CACHE = dict(config)
+    _CONFIG_MTIME = os.stat(CONFIG_FILE).st_mtime_ns
+
+    # Keep the running command's shared state in step with what was written
+    state = _cli_state()
+    if state is not None:
+        state["config"] = config
+        state.pop("canvas", None)
+
+
+def clear_config_cache():
+    """
+    Discard the in-process configuration cache, forcing the next call to
+    load_config() to re-read the .canvas file.
+    """
+    global _CONFIG_CACHE, _CONFIG_MTIME
+    _CONFIG_CACHE = None
+    _CONFIG_MTIME = None
+
+
+@functools.lru_cache(maxsize=4)
+def _canvas_for(api_url, api_key):
+    """Construct (once per process) a Canvas API instance for the given credentials."""
+    return Canvas(api_url, api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _course_for(course_id, api_url, api_key):
+    """Fetch (once per process) a Canvas course object for the given credentials."""
+    return _canvas_for(api_url, api_key).get_course(course_id)
+
+
+def _cli_state():
+    """
+    Get the per-invocation state dict set up by main(), or None when not
+    running inside a CLI command.
+    """
+    return _CLI_STATE.get()
+
+
+def get_config():
+    """
+    Get the configuration for the current command.
+
+    Returns:
+        dict: The configuration, loaded at most once per CLI invocation, or
+              freshly loaded from .canvas when called outside a CLI command.
+    """
+    state = _cli_state()
+    if state is None:
+        return load_config()
+    if "config" not in state:
+        state["config"] = load_config()
+    return state["config"]
+
 
 def get_canvas():
     """
@@ -89,8 +197,14 @@ def get_canvas():
     Returns:
         Canvas: Canvas API instance initialized with current API URL and key.
     """
-    config = load_config()
-    return Canvas(config["api_url"], config["api_key"])
+    state = _cli_state()
+    if state is not None and "canvas" in state:
+        return state["canvas"]
+    config = get_config()
+    canvas = _canvas_for(config["api_url"], config["api_key"])
+    if state is not None:
+        state["canvas"] = canvas
+    return canvas
 
 
 def get_course():
@@ -103,28 +217,134 @@ def get_course():
     Raises:
         RuntimeError: If no course is currently set in the configuration.
     """
-    config = load_config()
+    config = get_config()
     if config["current_course_id"] is None:
         raise RuntimeError("No course is currently set")
 
-    canvas = get_canvas()
-    return canvas.get_course(config["current_course_id"])
+    return _course_for(config["current_course_id"], config["api_url"], config["api_key"])
+
+
+def _assignments_by_name(course):
+    """
+    Get a dictionary of the course's assignments keyed by name.
+
+    The assignment list is fetched in a single paginated pass and cached
+    in-process, so repeated submissions against the same course do not
+    re-list every assignment.
+    """
+    if course.id not in _ASSIGNMENTS_BY_NAME:
+        by_name = {}
+        for assignment in course.get_assignments(per_page=PER_PAGE):
+            by_name.setdefault(assignment.name, assignment)
+        _ASSIGNMENTS_BY_NAME[course.id] = by_name
+    return _ASSIGNMENTS_BY_NAME[course.id]
+
+
+def _quizzes_by_title(course):
+    """
+    Get a dictionary of the course's quizzes keyed by title.
+
+    Cached in-process like _assignments_by_name().
+    """
+    if course.id not in _QUIZZES_BY_TITLE:
+        by_title = {}
+        for quiz in course.get_quizzes(per_page=PER_PAGE):
+            by_title.setdefault(quiz.title, quiz)
+        _QUIZZES_BY_TITLE[course.id] = by_title
+    return _QUIZZES_BY_TITLE[course.id]
+
+
+def _root_folder_id(course):
+    """
+    Get the ID of the course's root "course files" folder, or None if not found.
+
+    Cached in-process so batch uploads list the course folders only once.
+    """
+    if course.id not in _ROOT_FOLDER_IDS:
+        folders = course.get_folders(per_page=PER_PAGE)
+        _ROOT_FOLDER_IDS[course.id] = next(
+            (f.id for f in folders if f.name == "course files" and f.parent_folder_id is None),
+            None,
+        )
+    return _ROOT_FOLDER_IDS[course.id]
 
 
 #
 # Utility Functions
 #
+def _retry_rate_limited(func, *args, **kwargs):
+    """
+    Call func, retrying with exponential backoff while Canvas responds with
+    403 Rate Limit Exceeded.
+
+    Raises:
+        RateLimitExceeded: If the request is still throttled after RATE_LIMIT_RETRIES attempts.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES):
+        try:
+            return func(*args, **kwargs)
+        except RateLimitExceeded:
+            if attempt == RATE_LIMIT_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
 def parse_date(date_str):
     """
-    Parse a date string in a specific format.
+    Parse a date string in ISO 8601 or "Month DD, YYYY HH:MM" format.
+
+    YAML already loads most ISO 8601 values (e.g. 2026-01-15T09:30:00 or
+    2026-01-15) as datetime or date objects; these are accepted as well, with
+    a bare date taken as midnight.
 
     Args:
-        date_str (str): Date string in format "Month DD, YYYY HH:MM"
+        date_str (str): Date string, e.g. "2026-01-15T09:30" or "January 15, 2026 09:30"
 
     Returns:
         datetime: Parsed datetime object
     """
-    return datetime.datetime.strptime(date_str, "%B %d, %Y %H:%M")
+    if isinstance(date_str, datetime.datetime):
+        return date_str
+    if isinstance(date_str, datetime.date):
+        return datetime.datetime.combine(date_str, datetime.time())
+    try:
+        return datetime.datetime.fromisoformat(date_str)
+    except ValueError:
+        return datetime.datetime.strptime(date_str, "%B %d, %Y %H:%M")
+
+
+def _protect_math(content: str):
+    """
+    Replace each \\( ... \\) math expression in content with a placeholder.
+
+    Scans the string with str.find rather than a backtracking regex. An
+    expression must close on the same line it opens, as with the regex this
+    replaced.
+
+    Returns:
+        tuple: (protected_content, math_expressions) where math_expressions[i]
+               is the original text of placeholder MATH_PLACEHOLDER_i_
+    """
+    out = []
+    math_expressions = []
+    i = 0
+    j = content.find(r'\(')
+    while j >= 0:
+        end_of_line = content.find('\n', j + 2)
+        if end_of_line < 0:
+            end_of_line = len(content)
+        k = content.find(r'\)', j + 2, end_of_line)
+        if k < 0:
+            # Unclosed, and so is any later \( on this line; resume on the next
+            j = content.find(r'\(', end_of_line)
+            continue
+        out.append(content[i:j])
+        math_expressions.append(content[j:k + 2])
+        out.append(f"MATH_PLACEHOLDER_{len(math_expressions)-1}_")
+        i = k + 2
+        j = content.find(r'\(', i)
+    out.append(content[i:])
+    return "".join(out), math_expressions
 
 
 def render_markdown(content: str):
@@ -144,26 +364,21 @@ def render_markdown(content: str):
     Returns:
         str: HTML conversion of the Markdown with math expressions preserved
     """
-    import markdown
+    # Nothing to protect if there are no math delimiters
+    if r'\(' not in content:
+        return markdown.markdown(content)
 
     # Temporarily replace math sequences to protect them
-    math_expressions = []
-    def save_math(match):
-        math_expressions.append(match.group(0))
-        return f"MATH_PLACEHOLDER_{len(math_expressions)-1}_"
-
-    # Save math expressions
-    protected_md = re.sub(r'\\\(.*?\\\)', save_math, content)
+    protected_md, math_expressions = _protect_math(content)
 
     # Convert to HTML
     html = markdown.markdown(protected_md)
 
     # Restore math expressions
-    def restore_math(match):
-        index = int(match.group(1))
-        return math_expressions[index]
+    for i, expr in enumerate(math_expressions):
+        html = html.replace(f"MATH_PLACEHOLDER_{i}_", expr)
 
-    return re.sub(r'MATH_PLACEHOLDER_(\d+)_', restore_math, html)
+    return html
 
 
 def parse_assignment_file(file_path: str):
@@ -182,22 +397,19 @@ def parse_assignment_file(file_path: str):
         ValueError: If the file doesn't have a valid YAML header
         yaml.YAMLError: If there's an error parsing the YAML
     """
-    import yaml
-    import re
-
     with open(file_path, 'r') as f:
         content = f.read()
 
     # Check if file has valid YAML frontmatter format (between two '---' delimiters)
-    match = re.match(r'^---\n(.*?)\n---\n(.*)', content, re.DOTALL)
-    if not match:
+    parts = content[4:].split('\n---\n', 1) if content.startswith('---\n') else []
+    if len(parts) != 2:
         raise ValueError("Markdown file must have valid frontmatter between '---' delimiters")
 
     # Extract YAML header and markdown body
-    header_text, markdown_body = match.groups()
+    header_text, markdown_body = parts
 
     # Parse YAML header
-    header = yaml.safe_load(header_text)
+    header = yaml.load(header_text, Loader=_SafeLoader)
 
     # Validate required fields
     required_fields = ['name', 'points_possible']
@@ -215,38 +427,69 @@ def list_files():
     """
     List all files in the current course, showing the complete directory tree with IDs.
 
-    Recursively traverses all folders and displays files with their IDs and sizes.
+    Traverses all folders breadth-first, fetching the contents of each level
+    concurrently, then displays files with their IDs and sizes.
     """
     course = get_course()
 
-    def print_folder_contents(folder, indent=""):
-        """Recursively print folder contents with proper indentation."""
-        # Print folder information
-        print(f"{indent}📁 [bold]{folder.name}[/bold] (ID: {folder.id})")
-
-        # Get and print subfolders recursively
+    def fetch_contents(folder):
+        """Fetch a folder's subfolders and files (runs in a worker thread)."""
         try:
-            subfolders = folder.get_folders()
-            for subfolder in subfolders:
-                print_folder_contents(subfolder, indent + "  ")
+            subfolders = [f for f in folder.get_folders(per_page=PER_PAGE)]
         except Exception as e:
-            print(f"{indent}  [red]Error listing subfolders:[/red] {str(e)}")
-
-        # Get and print files in this folder
+            subfolders = e
         try:
-            files = folder.get_files()
-            for file in files:
-                size_str = f"{file.size} bytes" if hasattr(file, 'size') else "N/A"
-                print(f"{indent}  📄 {file.display_name} (ID: {file.id}, Size: {size_str})")
+            files = [f for f in folder.get_files(per_page=PER_PAGE)]
         except Exception as e:
-            print(f"{indent}  [red]Error listing files:[/red] {str(e)}")
+            files = e
+        return subfolders, files
+
+    def format_folder_contents(folder, contents, lines, indent=""):
+        """Recursively append prefetched folder contents to lines with proper indentation."""
+        # Folder information
+        lines.append(f"{indent}📁 [bold]{escape(folder.name)}[/bold] (ID: {folder.id})")
+        subfolders, files = contents[folder.id]
+
+        # Subfolders, recursively
+        if isinstance(subfolders, Exception):
+            lines.append(f"{indent}  [red]Error listing subfolders:[/red] {escape(str(subfolders))}")
+        else:
+            for subfolder in subfolders:
+                format_folder_contents(subfolder, contents, lines, indent + "  ")
+
+        # Files in this folder
+        if isinstance(files, Exception):
+            lines.append(f"{indent}  [red]Error listing files:[/red] {escape(str(files))}")
+        else:
+            for file in files:
+                size = getattr(file, 'size', None)
+                size_str = f"{size} bytes" if size is not None else "N/A"
+                lines.append(f"{indent}  📄 {escape(file.display_name)} (ID: {file.id}, Size: {size_str})")
 
     try:
         # Start from course root folders
         print(f"[bold]Complete directory tree for course:[/bold]")
-        root_folders = course.get_folders()
+        root_folders = [f for f in course.get_folders(per_page=PER_PAGE)]
+
+        # Walk the tree one level at a time, fetching each level concurrently
+        contents = {}
+        level = root_folders
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            while level:
+                level = [f for f in {f.id: f for f in level}.values() if f.id not in contents]
+                next_level = []
+                for folder, result in zip(level, executor.map(fetch_contents, level)):
+                    contents[folder.id] = result
+                    if not isinstance(result[0], Exception):
+                        next_level.extend(result[0])
+                level = next_level
+
+        # Render the whole tree and write it out at once
+        lines = []
         for folder in root_folders:
-            print_folder_contents(folder)
+            format_folder_contents(folder, contents, lines)
+        if lines:
+            print("\n".join(lines))
     except Exception as e:
         print(f"[red]Error accessing folders:[/red] {str(e)}")
 
@@ -323,16 +566,11 @@ def submit_assignment(
         return
 
     course = get_course()
-    existing_assignment = None
-
-    for assignment in course.get_assignments():
-        if assignment.name == header['name']:
-            existing_assignment = assignment
-            if not edit:
-                print("[yellow]Assignment exists; use --edit to modify it[/yellow]")
-                return
-            else:
-                break
+    existing_assignment = _assignments_by_name(course).get(header['name'])
+
+    if existing_assignment and not edit:
+        print("[yellow]Assignment exists; use --edit to modify it[/yellow]")
+        return
 
     if existing_assignment:
         assignment = existing_assignment.edit(assignment=assignment_params)
@@ -343,6 +581,11 @@ def submit_assignment(
         status = "published" if publish else "unpublished"
         print(f"[green]Assignment created successfully:[/green] {assignment.name} (ID: {assignment.id}) - {status}")
 
+    # Refresh the cached lookup entry with the object Canvas returned
+    by_name = _assignments_by_name(course)
+    by_name.pop(header['name'], None)
+    by_name[assignment.name] = assignment
+
 
 def submit_quiz(
     filename: str,
@@ -353,11 +596,9 @@ def submit_quiz(
     """
     Create or update a sample quiz in Canvas from a YAML file
     """
-    import yaml
-
     # Parse placement exam configuration
     with open(filename, "r") as f:
-        quiz = yaml.safe_load(f)
+        quiz = yaml.load(f, Loader=_SafeLoader)
 
     header = {**quiz, "published": publish}
     header.pop("questions", None)
@@ -370,16 +611,11 @@ def submit_quiz(
         return
 
     course = get_course()
-    existing_quiz = None
-
-    for quiz in course.get_quizzes():
-        if quiz.title == header['title']:
-            existing_quiz = quiz
-            if not edit:
-                print("[yellow]Quiz exists; use --edit to modify it[/yellow]")
-                return
-            else:
-                break
+    existing_quiz = _quizzes_by_title(course).get(header['title'])
+
+    if existing_quiz and not edit:
+        print("[yellow]Quiz exists; use --edit to modify it[/yellow]")
+        return
 
     if existing_quiz:
         quiz = existing_quiz.edit(quiz=header)
@@ -389,22 +625,43 @@ def submit_quiz(
         quiz = course.create_quiz(header)
         print(f"[green]Creating new quiz[/green] {quiz.title} (ID: {quiz.id})")
 
-    # Delete all existing questions
-    for question in quiz.get_questions():
-        question.delete()
+    by_title = _quizzes_by_title(course)
+    by_title.pop(header['title'], None)
+    by_title[quiz.title] = quiz
 
-    def to_canvas_api(question: dict):
+    def to_canvas_api(position: int, question: dict):
         answers = question['answers']
         return {
             'question_name': question['question_name'],
             'question_text': question['question_text'],
             'question_type': 'multiple_choice_question',
             'points_possible': 1,
+            'position': position,
             'answers': [dict(text=text, weight=100 if question["correct"] == choice else 0) for choice, text in answers.items()]
         }
 
-    for question in questions:
-        quiz.create_question(question=to_canvas_api(question))
+    def run_all(executor, func, items):
+        """Run func on every item, returning the errors rather than stopping at the first."""
+        futures = [executor.submit(_retry_rate_limited, func, item) for item in items]
+        return [f.exception() for f in futures if f.exception() is not None]
+
+    # Delete all existing questions, then create the new ones; the requests
+    # are independent so issue them concurrently. The existing questions are
+    # listed in full first, since deleting shifts later pages of the listing.
+    # Explicit positions keep the question order stable regardless of
+    # completion order.
+    old_questions = [q for q in quiz.get_questions(per_page=PER_PAGE)]
+    bodies = [to_canvas_api(n, question) for n, question in enumerate(questions, start=1)]
+    with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as executor:
+        delete_errors = run_all(executor, lambda q: q.delete(), old_questions)
+        create_errors = run_all(executor, lambda body: quiz.create_question(question=body), bodies)
+
+    if delete_errors or create_errors:
+        print(f"[red]Error updating quiz questions:[/red] {len(delete_errors)} of {len(old_questions)} deletes "
+              f"and {len(create_errors)} of {len(bodies)} creates failed; re-run with --edit to retry")
+        for e in delete_errors + create_errors:
+            print(f"  {escape(str(e))}")
+        return
 
     print(f"[green]Quiz operation completed successfully with ID: {quiz.id}[/green]")
 
@@ -422,11 +679,9 @@ def upload_file(file_path: str, hidden: bool = True, parent_folder_id: int = Non
 
     # If no parent folder specified, use course root folder
     if parent_folder_id is None:
-        for folder in course.get_folders():
-            if folder.name == "course files" and folder.parent_folder_id is None:
-                parent_folder_id = folder.id
-                print(f"Using course root folder (ID: {parent_folder_id})")
-                break
+        parent_folder_id = _root_folder_id(course)
+        if parent_folder_id is not None:
+            print(f"Using course root folder (ID: {parent_folder_id})")
 
     if not os.path.exists(file_path):
         print(f"[red]Error:[/red] File '{file_path}' does not exist")
@@ -450,8 +705,12 @@ def upload_file(file_path: str, hidden: bool = True, parent_folder_id: int = Non
     print(f"Uploading {file_name} ({file_size} bytes)...")
 
     success, info = course.upload(file_path, **params)
-    uploaded_file = course.get_file(info["id"])
-    uploaded_file.update(hidden=hidden)
+
+    # The upload response is the full file record, so build the File locally
+    # rather than fetching it again, and only update visibility if needed
+    if info.get("hidden") != hidden:
+        uploaded_file = File(course._requester, info)
+        uploaded_file.update(hidden=hidden)
 
     print(f"[green]File uploaded successfully[/green]")
 
@@ -459,6 +718,20 @@ def upload_file(file_path: str, hidden: bool = True, parent_folder_id: int = Non
 #
 # CLI Commands
 #
+@app.callback()
+def main(ctx: Context):
+    """
+    Command-line interface for the Canvas LMS API.
+    """
+    # Share state with every command so the configuration is loaded, and the
+    # Canvas API instance built, at most once per invocation. Both are filled
+    # in lazily by get_config() and get_canvas(). State passed in via obj
+    # (e.g. from a test runner) is left in place.
+    state = ctx.ensure_object(dict)
+    token = _CLI_STATE.set(state)
+    ctx.call_on_close(lambda: _CLI_STATE.reset(token))
+
+
 @app.command()
 def list(what: ListItem, detail: bool = False):
     """
@@ -473,11 +746,11 @@ def list(what: ListItem, detail: bool = False):
 
     match what:
         case ListItem.COURSES:
-            courses = canvas.get_courses()
+            courses = canvas.get_courses(per_page=PER_PAGE)
             for course in courses:
                 print(f"Course ID: {course.id}, Name: {course.name}")
         case ListItem.ASSIGNMENTS:
-            assignments = course.get_assignments()
+            assignments = course.get_assignments(per_page=PER_PAGE)
             for assignment in assignments:
                 print(f"Assignment ID: {assignment.id}, Name: {assignment.name}, Submission Types: {assignment.submission_types}")
                 if detail:
@@ -485,16 +758,16 @@ def list(what: ListItem, detail: bool = False):
         case ListItem.FILES:
             list_files()
         case ListItem.STUDENTS:
-            students = course.get_users(enrollment_type='student')
+            students = course.get_users(enrollment_type='student', per_page=PER_PAGE)
             for student in students:
                 print(f"Student ID: {student.id}, Name: {student.name}, Email: {getattr(student, 'email', 'N/A')}")
         case ListItem.ASSIGNMENT_GROUPS:
-            groups = course.get_assignment_groups()
+            groups = course.get_assignment_groups(per_page=PER_PAGE)
             for group in groups:
                 weight = getattr(group, 'group_weight', 'N/A')
                 print(f"Group ID: {group.id}, Name: {group.name}, Weight: {weight}")
         case ListItem.QUIZZES:
-            quizzes = course.get_quizzes()
+            quizzes = course.get_quizzes(per_page=PER_PAGE)
             for quiz in quizzes:
                 print(f"Quiz ID: {quiz.id}, Title: {quiz.title}")
                 print(f"  Points: {quiz.points_possible}")
@@ -511,13 +784,12 @@ def set(what: ConfigItem, value: str):
         what (ConfigItem): Type of configuration to set (course, api_url, api_key)
         value (str): The value to set
     """
-    config = load_config()
+    config = get_config()
 
     match what:
         case ConfigItem.COURSE:
             course_id = int(value)
-            canvas = get_canvas()
-            course = canvas.get_course(course_id)
+            course = _course_for(course_id, config["api_url"], config["api_key"])
             config["current_course_id"] = course_id
             save_config(config)
             print(f"Current Course ID: {course.id}, Name: {course.name}")
@@ -541,13 +813,12 @@ def show(what: ConfigItem):
     Args:
         what (ConfigItem): Type of configuration to show (course, api_url, api_key)
     """
-    config = load_config()
+    config = get_config()
 
     match what:
         case ConfigItem.COURSE:
             if config["current_course_id"] is not None:
-                canvas = get_canvas()
-                course = canvas.get_course(config["current_course_id"])
+                course = get_course()
                 print(f"Current Course ID: {course.id}, Name: {course.name}")
             else:
                 print("No course is currently set")
@@ -600,23 +871,23 @@ def gradebook():
     Retrieves all students and their grades for all assignments in the current course.
     """
     course = get_course()
-    students = course.get_users(enrollment_type=['student'])
+    students = course.get_users(enrollment_type=['student'], per_page=PER_PAGE)
     user_map = {student.id: student.sortable_name for student in students}
 
     # Get all assignments
-    assignments = course.get_assignments()
+    assignments = course.get_assignments(per_page=PER_PAGE)
+    assignment_names = {assignment.id: assignment.name for assignment in assignments}
 
     # Create an empty gradebook dictionary
     gradebook = {uid: {} for uid in user_map}
 
-    # Collect grades for each assignment
-    for assignment in assignments:
-        print(assignment)
-        submissions = assignment.get_submissions()
-        for sub in submissions:
-            uid = sub.user_id
-            if uid in gradebook:
-                gradebook[uid][assignment.name] = sub.score
+    # Collect grades for every student and assignment from a single paginated
+    # submissions stream, rather than one request per assignment
+    submissions = course.get_multiple_submissions(student_ids=['all'], per_page=PER_PAGE)
+    for sub in submissions:
+        uid = sub.user_id
+        if uid in gradebook and sub.assignment_id in assignment_names:
+            gradebook[uid][assignment_names[sub.assignment_id]] = sub.score
 
     for uid in gradebook:
         print(user_map[uid], gradebook[uid])
@@ -641,7 +912,7 @@ def describe(what: DescribeItem, canvas_id: int):
             print(f"Description: {quiz.description}")
             print("\nQuestions:")
 
-            questions = quiz.get_questions()
+            questions = quiz.get_questions(per_page=PER_PAGE)
             for question in questions:
                 print(f"\nQuestion {question.position}:")
                 print(f"Type: {question.question_type}")